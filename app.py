@@ -5,6 +5,10 @@ Single-file entry point. Delegates all business logic to app/ modules.
 import json
 import os
 import re
+import uuid
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 
 import streamlit as st
 from dotenv import load_dotenv
@@ -12,7 +16,13 @@ from dotenv import load_dotenv
 load_dotenv()
 
 # ── Local storage ─────────────────────────────────────────────────────────────
-from app.storage.local import save_interview
+from app.storage.local import (
+    cleanup_old_checkpoints,
+    delete_checkpoint,
+    load_checkpoint,
+    save_checkpoint,
+    save_interview,
+)
 
 # ── Groq client (lazy, cached) ───────────────────────────────────────────────
 @st.cache_resource(show_spinner=False)
@@ -20,6 +30,19 @@ def _groq_client():
     from app.ai.client import get_client
     return get_client()
 
+
+# ── Background worker pool (shared across reruns and sessions) ──────────────
+@st.cache_resource(show_spinner=False)
+def _executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="talentscout")
+
+
+# Transition drafts are best-effort and often abandoned mid-flight; keep them off
+# the main pool so a stuck draft never delays question prefetch or compaction.
+@st.cache_resource(show_spinner=False)
+def _transition_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="talentscout-transition")
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Constants
 # ─────────────────────────────────────────────────────────────────────────────
@@ -31,10 +54,24 @@ PHASES = {
     "ENDED": "ended",
 }
 
-EXIT_KEYWORDS = {
-    "bye", "goodbye", "exit", "quit", "end", "stop",
-    "finish", "done", "thanks", "thank you",
-}
+# Chat history compaction: once the log exceeds MAX_RAW_MESSAGES, everything but
+# the last KEEP_RAW_MESSAGES is summarised in the background and folded into one
+# message on a later run. Sized so a normal interview (~30 messages) never compacts.
+MAX_RAW_MESSAGES = 40
+KEEP_RAW_MESSAGES = 24
+
+# Session state written to the on-disk checkpoint (everything but transient handles/IDs)
+CHECKPOINT_KEYS = (
+    "page", "phase", "messages", "compacted_count", "candidate", "step",
+    "experience_value", "experience_level", "questions", "q_index",
+    "evaluations", "scores", "summary",
+)
+
+# Whole-word match so "end" in "friend" or "backend" no longer ends the interview
+EXIT_RE = re.compile(
+    r"\b(?:bye|goodbye|exit|quit|stop|finish|done|thanks|thank\s+you)\b",
+    re.IGNORECASE,
+)
 
 GRADE_CONFIG = {
     "A": {"color": "#28a745", "label": "Excellent", "emoji": "🏆"},
@@ -51,40 +88,200 @@ RECOMMENDATION_LABELS = {
     "no_hire":     ("No Hire",     "#dc3545"),
 }
 
+# Validation patterns — compiled once at import, reused on every submit
+NAME_RE = re.compile(r"^[a-zA-Z][a-zA-Z\s'\-]{1,49}$")
+EMAIL_PATTERN = r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}"
+EMAIL_RE = re.compile(rf"^{EMAIL_PATTERN}$")
+PHONE_RE = re.compile(r"^\+?\d{10,15}$")
+PHONE_STRIP_RE = re.compile(r"[^0-9]")
+WHITESPACE_RE = re.compile(r"\s")
+FLOAT_RE = re.compile(r"^\d+(\.\d+)?$")
+WORD_RE = re.compile(r"[a-z]+")
+CONSONANT_RUN_RE = re.compile(r"[^aeiouy]{6,}")
+
+ITEM_SPLIT_RE = re.compile(r"\s*(?:[,/;&|]|\band\b)\s*")
+
+# Per-field lexicons for the local plausibility check. Only words of 3+ letters
+# that are specific to the field live here; a hit accepts without asking the
+# model. Generic modifiers ("data", "senior", "full") are deliberately left out.
+_FIELD_LEXICONS = {
+    "position": frozenset({
+        "developer", "engineer", "programmer", "architect", "analyst", "scientist",
+        "designer", "manager", "intern", "consultant", "administrator", "tester",
+        "devops", "backend", "frontend", "fullstack", "recruiter", "director",
+    }),
+    "location": frozenset({
+        "remote", "hybrid", "onsite", "bangalore", "bengaluru", "mumbai", "delhi",
+        "noida", "gurgaon", "gurugram", "hyderabad", "pune", "chennai", "kolkata",
+        "jaipur", "ahmedabad", "indore", "chandigarh", "kochi", "london", "berlin",
+        "paris", "amsterdam", "dublin", "toronto", "vancouver", "singapore", "dubai",
+        "sydney", "melbourne", "tokyo", "francisco", "seattle", "austin", "boston",
+        "chicago", "india", "canada", "germany", "australia",
+    }),
+    "tech_stack": frozenset({
+        "python", "java", "javascript", "typescript", "cpp", "golang", "ruby",
+        "php", "kotlin", "scala", "sql", "nosql", "html", "css", "react", "angular",
+        "vue", "nodejs", "django", "flask", "fastapi", "laravel", "dotnet", "aspnet",
+        "android", "ios", "flutter", "postgresql", "postgres", "mysql", "mongodb",
+        "redis", "sqlite", "aws", "azure", "gcp", "docker", "kubernetes",
+        "terraform", "linux", "git", "graphql", "kafka", "hadoop", "pandas",
+        "numpy", "tensorflow", "pytorch", "sklearn", "nlp", "llm", "tableau",
+        "powerbi",
+    }),
+}
+
+# Short or ambiguous entries, accepted only when a whole comma-separated item equals one
+_FIELD_EXACT_ENTRIES = {
+    "position": frozenset({"qa", "sre", "sde", "swe", "cto"}),
+    "location": frozenset({"uk", "us", "usa", "uae", "nyc", "sf", "new york", "san francisco"}),
+    "tech_stack": frozenset({
+        "c", "c++", "c#", "go", "r", "rust", "swift", ".net", "node", "next.js",
+        "spring", "express", "rails", "spark", "excel", "rest", "ml", "dl", "ai",
+    }),
+}
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Input validation (AI-assisted for free-text fields)
 # ─────────────────────────────────────────────────────────────────────────────
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_ai_validate(field_name: str, norm_input: str) -> bool:
+    """Groq plausibility check; cached across reruns, errors are not cached."""
+    client = _groq_client()
+    resp = client.chat.completions.create(
+        messages=[{
+            "role": "system",
+            "content": f"Plausible {field_name}? Value: {norm_input}. Answer y or n.",
+        }],
+        model="llama-3.1-8b-instant",
+        max_tokens=1,
+        temperature=0.0,
+    )
+    return resp.choices[0].message.content.strip()[:1].lower() == "y"
+
+
 def _ai_validate(user_input: str, field_name: str) -> bool:
     try:
-        client = _groq_client()
-        resp = client.chat.completions.create(
-            messages=[{
-                "role": "system",
-                "content": (
-                    f"Is '{user_input}' a plausible real-world '{field_name}'? "
-                    "Respond with only 'yes' or 'no'."
-                ),
-            }],
-            model="llama-3.1-8b-instant",
-            max_tokens=5,
-            temperature=0.0,
-        )
-        return "yes" in resp.choices[0].message.content.strip().lower()
+        return _cached_ai_validate(field_name, user_input.strip().lower())
     except Exception:
         return len(user_input.strip()) > 2
 
 
+def _looks_plausible(text: str, field: str) -> bool | None:
+    """Cheap local verdict for one field: True/False when obvious, None when the model should decide."""
+    lower = text.strip().lower()
+    if any(item in _FIELD_EXACT_ENTRIES[field] for item in ITEM_SPLIT_RE.split(lower)):
+        return True
+    words = WORD_RE.findall(lower)
+    if not words:
+        return None  # non-Latin script or symbols only — let the model decide
+    lexicon = _FIELD_LEXICONS[field]
+    known = any(w in lexicon for w in words)
+    # Tokens of 3 letters or fewer are mostly acronyms (JS, HR, NCR) — never judge them
+    unknown = [w for w in words if w not in lexicon and len(w) > 3]
+    gibberish = bool(unknown) and (
+        sum(ch in "aeiouy" for w in unknown for ch in w) / sum(map(len, unknown)) < 0.1
+        or any(CONSONANT_RUN_RE.search(w) for w in unknown)
+    )
+    if known:
+        # A lexicon hit is never rejected locally; odd leftovers go to the batched check
+        return None if gibberish else True
+    return False if gibberish else None
+
+
+def _parse_verdict(value) -> bool | None:
+    """Map a JSON-mode yes/no reply to a bool; None when it is not a recognisable verdict."""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        text = value.strip().lower()
+        if text in ("y", "yes", "true"):
+            return True
+        if text in ("n", "no", "false"):
+            return False
+    return None
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_ai_validate_bulk(items: tuple[tuple[str, str, str], ...]) -> dict[str, bool | None]:
+    """One Groq call for several (field, label, value) triples → {field: verdict or None}."""
+    client = _groq_client()
+    listing = "\n".join(f"- {field} ({label}): '{value}'" for field, label, value in items)
+    resp = client.chat.completions.create(
+        messages=[{
+            "role": "system",
+            "content": (
+                "Is each value a plausible real entry for its label (not gibberish)?\n"
+                f"{listing}\n"
+                "Return JSON mapping each field key to \"y\" or \"n\"."
+            ),
+        }],
+        model="llama-3.1-8b-instant",
+        max_tokens=40,
+        temperature=0.0,
+        response_format={"type": "json_object"},
+    )
+    parsed = json.loads(resp.choices[0].message.content)
+    if not isinstance(parsed, dict):
+        parsed = {}
+    return {field: _parse_verdict(parsed.get(field)) for field, _, _ in items}
+
+
+def _ai_validate_bulk(data: dict) -> dict[str, bool]:
+    """Validate every collected free-text field the local check could not decide."""
+    items = tuple(
+        (cfg["field"], cfg["ai_label"], data[cfg["field"]].strip().lower())
+        for cfg in DATA_STEPS.values()
+        if "ai_label" in cfg
+        and data.get(cfg["field"])
+        and _looks_plausible(data[cfg["field"]], cfg["field"]) is None
+    )
+    if not items:
+        return {}
+    try:
+        verdicts = _cached_ai_validate_bulk(items)
+    except Exception:
+        return {field: len(value) > 2 for field, _, value in items}
+    # Missing or malformed answers fall back to the per-field check, never to "accept"
+    return {
+        field: verdicts.get(field) if verdicts.get(field) is not None else _ai_validate(value, label)
+        for field, label, value in items
+    }
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Input extractors — strip conversational preamble, return the clean value
 # ─────────────────────────────────────────────────────────────────────────────
+NAME_LEADIN_RE = re.compile(
+    r"(?:my name is|i am|i'm|im|call me|this is|name\s*[:\-]\s*)"
+    r"\s*([a-zA-Z][a-zA-Z\s'\-]{0,49})",
+    re.IGNORECASE,
+)
+EMAIL_SEARCH_RE = re.compile(EMAIL_PATTERN)
+FRESHER_RE = re.compile(
+    r"\b(fresher|fresh graduate|no experience|zero|0 year|just started|just graduated|entry.?level)\b"
+)
+YEARS_RE = re.compile(r"\b(\d+(?:\.\d+)?)\s*(?:years?|yrs?|y\.?o\.?e\.?)?\b", re.IGNORECASE)
+FREETEXT_PREFIX_RES = tuple(
+    re.compile(pat, re.IGNORECASE)
+    for pat in (
+        r"^i(?:'m| am) (?:applying for|looking for|interested in|seeking)\s+(?:a |an |the )?",
+        r"^(?:i prefer|my preferred(?:\s+location)? is|i(?:'m| am) (?:based in|from|in|at))\s+",
+        r"^(?:i(?:'m| am) (?:proficient in|skilled in|experienced(?:\s+in)?|good at|familiar with|working with))\s+",
+        r"^(?:my (?:tech stack|skills?|technologies|expertise) (?:is|are|includes?)[:\s]+)\s*",
+        r"^(?:position|role|job|location|tech|stack|skills?)\s*[:\-]\s*",
+    )
+)
+REPEATED_DIGIT_RE = re.compile(r"(.)\1{6,}")
+_FAKE_PHONES = frozenset({
+    "1234567890", "0123456789", "9876543210", "0987654321",
+    "1234567891", "12345678901", "123456789",
+})
+
+
 def _extract_name(raw: str) -> str:
     """'My name is Amit Kumar' → 'Amit Kumar'"""
     raw = raw.strip()
-    m = re.search(
-        r"(?:my name is|i am|i'm|im|call me|this is|name\s*[:\-]\s*)"
-        r"\s*([a-zA-Z][a-zA-Z\s'\-]{0,49})",
-        raw, re.IGNORECASE,
-    )
+    m = NAME_LEADIN_RE.search(raw)
     if m:
         return m.group(1).strip()
     return raw
@@ -92,14 +289,14 @@ def _extract_name(raw: str) -> str:
 
 def _extract_email(raw: str) -> str:
     """'my email is amit@gmail.com' → 'amit@gmail.com'"""
-    m = re.search(r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}", raw)
+    m = EMAIL_SEARCH_RE.search(raw)
     return m.group(0).strip() if m else raw.strip()
 
 
 def _extract_phone(raw: str) -> str:
     """'my number is +91 98765 43210' → '+919876543210'"""
     raw = raw.strip()
-    digits = re.sub(r"[^0-9]", "", raw)
+    digits = PHONE_STRIP_RE.sub("", raw)
     # keep leading + for international numbers
     return ("+" + digits) if raw.lstrip().startswith("+") and digits else digits if digits else raw
 
@@ -107,44 +304,33 @@ def _extract_phone(raw: str) -> str:
 def _extract_experience(raw: str) -> str:
     """'I have 3.5 years of experience' → '3.5', 'fresher' → '0'"""
     lower = raw.lower()
-    if re.search(r"\b(fresher|fresh graduate|no experience|zero|0 year|just started|just graduated|entry.?level)\b", lower):
+    if FRESHER_RE.search(lower):
         return "0"
-    m = re.search(r"\b(\d+(?:\.\d+)?)\s*(?:years?|yrs?|y\.?o\.?e\.?)?\b", raw, re.IGNORECASE)
+    m = YEARS_RE.search(raw)
     return m.group(1) if m else raw.strip()
 
 
 def _extract_freetext(raw: str) -> str:
     """Strip common conversational lead-ins for position/location/tech-stack."""
-    prefixes = [
-        r"^i(?:'m| am) (?:applying for|looking for|interested in|seeking)\s+(?:a |an |the )?",
-        r"^(?:i prefer|my preferred(?:\s+location)? is|i(?:'m| am) (?:based in|from|in|at))\s+",
-        r"^(?:i(?:'m| am) (?:proficient in|skilled in|experienced(?:\s+in)?|good at|familiar with|working with))\s+",
-        r"^(?:my (?:tech stack|skills?|technologies|expertise) (?:is|are|includes?)[:\s]+)\s*",
-        r"^(?:position|role|job|location|tech|stack|skills?)\s*[:\-]\s*",
-    ]
     result = raw.strip()
-    for pat in prefixes:
-        result = re.sub(pat, "", result, flags=re.IGNORECASE).strip()
+    for pat in FREETEXT_PREFIX_RES:
+        result = pat.sub("", result).strip()
     return result.strip("\"'").strip() or raw.strip()
 
 
 def _is_fake_phone(digits: str) -> bool:
     """Return True if the digit string looks like a placeholder/fake number."""
-    d = re.sub(r"[^0-9]", "", digits)
+    d = PHONE_STRIP_RE.sub("", digits)
     if not d:
         return True
     # All same digit (e.g. 9999999999)
     if len(set(d)) == 1:
         return True
     # Classic sequential fillers
-    _FAKES = {
-        "1234567890", "0123456789", "9876543210", "0987654321",
-        "1234567891", "12345678901", "123456789",
-    }
-    if d in _FAKES or d[:10] in _FAKES:
+    if d in _FAKE_PHONES or d[:10] in _FAKE_PHONES:
         return True
     # 7+ consecutive identical digits anywhere (e.g. 98111111112)
-    if re.search(r"(.)\1{6,}", d):
+    if REPEATED_DIGIT_RE.search(d):
         return True
     return False
 
@@ -155,7 +341,7 @@ DATA_STEPS = {
         "prompt": "What is your full name?",
         "extractor": _extract_name,
         "validation": lambda x: (
-            bool(re.match(r"^[a-zA-Z][a-zA-Z\s'\-]{1,49}$", x.strip()))
+            bool(NAME_RE.match(x.strip()))
             and 2 <= len(x.strip()) <= 50
         ),
         "error": "Please share your name using letters only (e.g. Amit Kumar).",
@@ -165,8 +351,8 @@ DATA_STEPS = {
         "prompt": "Could you share your email address?",
         "extractor": _extract_email,
         "validation": lambda x: (
-            bool(re.match(r"^[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}$", x.strip()))
-            and _ai_validate(x, "real personal or professional email address (not random characters or gibberish)")
+            bool(EMAIL_RE.match(x.strip()))
+            and _ai_validate(x, "real email address")
         ),
         "error": "That doesn't look like a real email address. Please provide one you actually use, e.g. amit@gmail.com.",
     },
@@ -175,7 +361,7 @@ DATA_STEPS = {
         "prompt": "What is your phone number?",
         "extractor": _extract_phone,
         "validation": lambda x: (
-            bool(re.match(r"^\+?\d{10,15}$", re.sub(r"\s", "", x)))
+            bool(PHONE_RE.match(WHITESPACE_RE.sub("", x)))
             and not _is_fake_phone(x)
         ),
         "error": "Please provide your actual phone number (10–15 digits). Sequential or repeated digits like 1234567890 are not accepted.",
@@ -184,7 +370,7 @@ DATA_STEPS = {
         "field": "experience",
         "prompt": "How many years of professional experience do you have?",
         "extractor": _extract_experience,
-        "validation": lambda x: bool(re.match(r"^\d+(\.\d+)?$", x.strip()))
+        "validation": lambda x: bool(FLOAT_RE.match(x.strip()))
                                  and 0 <= float(x.strip()) <= 50,
         "error": "Please give a number for years of experience — e.g. 0 for fresher, 3, or 5.5.",
     },
@@ -192,25 +378,54 @@ DATA_STEPS = {
         "field": "position",
         "prompt": "What position are you applying for?",
         "extractor": _extract_freetext,
-        "validation": lambda x: len(x.strip()) >= 2 and _ai_validate(x, "Job Position"),
+        "validation": lambda x: len(x.strip()) >= 2 and _looks_plausible(x, "position") is not False,
+        "ai_label": "Job Position",
         "error": "Please provide a recognisable job title, e.g. 'Backend Developer'.",
     },
     6: {
         "field": "location",
         "prompt": "What is your preferred work location? (city or 'remote')",
         "extractor": _extract_freetext,
-        "validation": lambda x: len(x.strip()) >= 2 and _ai_validate(x, "Work Location"),
+        "validation": lambda x: len(x.strip()) >= 2 and _looks_plausible(x, "location") is not False,
+        "ai_label": "Work Location",
         "error": "Please provide a city name or type 'remote'.",
     },
     7: {
         "field": "tech_stack",
         "prompt": "What programming languages, frameworks, and technologies are you proficient in?",
         "extractor": _extract_freetext,
-        "validation": lambda x: len(x.strip()) >= 2 and _ai_validate(x, "Technology Stack"),
+        "validation": lambda x: len(x.strip()) >= 2 and _looks_plausible(x, "tech_stack") is not False,
+        "ai_label": "Technology Stack",
         "error": "Please list at least one technology, e.g. 'Python, Django, PostgreSQL'.",
     },
 }
 
+
+def _experience_message(exp: float) -> str:
+    if exp == 0:
+        return "Just starting out — exciting!"
+    if exp < 2:
+        return f"{exp} years — great foundation!"
+    if exp < 5:
+        return f"{exp} years of solid experience!"
+    return f"{exp} years — impressive!"
+
+
+# Acknowledgement after each accepted step; ctx has .first, .data and .experience.
+# Step 7 has no entry — it always hands over to the confirmation summary.
+STEP_RESPONSES: dict[int, Callable[[SimpleNamespace], str]] = {
+    1: lambda ctx: f"Great to meet you, {ctx.first}! 😊 Next — {DATA_STEPS[2]['prompt']}",
+    2: lambda ctx: f"Got it, {ctx.first}. Next — {DATA_STEPS[3]['prompt']}",
+    3: lambda ctx: f"Perfect, {ctx.first}. Next — {DATA_STEPS[4]['prompt']}",
+    4: lambda ctx: (
+        f"{_experience_message(ctx.experience)} {DATA_STEPS[5]['prompt']}"
+    ),
+    5: lambda ctx: (
+        f"A **{ctx.data['position']}** role — excellent choice! {DATA_STEPS[6]['prompt']}"
+    ),
+    6: lambda ctx: f"Location noted. Last one — {DATA_STEPS[7]['prompt']}",
+}
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Session state helpers
 # ─────────────────────────────────────────────────────────────────────────────
@@ -219,12 +434,18 @@ def _init_session():
         "page": "home",
         "phase": PHASES["GREETING"],
         "messages": [],
+        "compacted_count": 0,     # raw messages folded into the history summary
+        "compaction_future": None,  # Future[str] from _schedule_compaction()
+        "compaction_cut": 0,      # messages[:cut] are replaced when it resolves
         "candidate": {
             "name": "", "email": "", "phone": "", "experience": "",
             "position": "", "location": "", "tech_stack": "",
         },
         "step": 1,
+        "experience_value": None, # float, parsed once when step 4 is accepted
+        "experience_level": "",   # entry-level | mid-level | senior-level
         "questions": [],          # list[dict] — {question, difficulty}
+        "questions_future": None, # Future from _prefetch_questions()
         "question_ids": [],       # DB IDs
         "q_index": 0,
         "evaluations": [],        # list[dict] from answer_evaluator
@@ -235,17 +456,85 @@ def _init_session():
         "interview_id": None,
         "retry_count": 0,
     }
+    if "session_id" not in st.session_state:
+        # The id rides in the URL, so a refresh or server restart finds the checkpoint
+        sid = st.query_params.get("sid", "")
+        restored = load_checkpoint(sid)
+        if restored is None:
+            _sweep_checkpoints()
+            sid = uuid.uuid4().hex
+            st.query_params["sid"] = sid
+            restored = {}
+        st.session_state.session_id = sid
+        for k in CHECKPOINT_KEYS:
+            if k in restored:
+                st.session_state[k] = restored[k]
     for k, v in defaults.items():
         if k not in st.session_state:
             st.session_state[k] = v
 
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def _sweep_checkpoints() -> int:
+    """Drop abandoned checkpoints; cached so it runs at most hourly per process."""
+    return cleanup_old_checkpoints()
+
+
+def _checkpoint():
+    # A finished interview lives in data/interviews/ once saved, and an exit ends the
+    # session; neither needs a resumable copy. Keep it only if the final save failed.
+    if st.session_state.phase == PHASES["ENDED"] and (
+        st.session_state.interview_id or not st.session_state.summary
+    ):
+        delete_checkpoint(st.session_state.session_id)
+        return
+    save_checkpoint(
+        st.session_state.session_id,
+        {k: st.session_state[k] for k in CHECKPOINT_KEYS},
+    )
+
+
 def _reset():
+    delete_checkpoint(st.session_state.get("session_id", ""))
+    st.query_params.clear()
     for k in list(st.session_state.keys()):
         del st.session_state[k]
     st.rerun()
 
 
+def _append_message(role: str, content: str) -> None:
+    st.session_state.messages.append({"role": role, "content": content})
+
+
+def _schedule_compaction() -> None:
+    """Once the reply is on screen, start summarising the oldest block in the background."""
+    msgs = st.session_state.messages
+    if st.session_state.compaction_future is not None or len(msgs) <= MAX_RAW_MESSAGES:
+        return
+    cut = len(msgs) - KEEP_RAW_MESSAGES
+    st.session_state.compaction_cut = cut
+    st.session_state.compaction_future = _executor().submit(_summarize_messages, msgs[:cut])
+
+
+def _apply_compaction() -> None:
+    """Swap a finished background summary in for the block it covers."""
+    future = st.session_state.compaction_future
+    if future is None or not future.done():
+        return
+    st.session_state.compaction_future = None
+    try:
+        summary = future.result()
+    except Exception:
+        return  # keep the raw history; the next turn schedules a retry
+    cut = st.session_state.compaction_cut
+    head = st.session_state.messages[:cut]
+    st.session_state.compacted_count += sum(1 for m in head if not m.get("summary"))
+    st.session_state.messages = [
+        {"role": "assistant", "content": f"**Summary so far:** {summary}", "summary": True},
+        *st.session_state.messages[cut:],
+    ]
+
+
 def _first_name(data: dict | None = None) -> str:
     """Safely extract first name from candidate data, fall back to 'there'."""
     if data is None:
@@ -258,41 +547,118 @@ def _first_name(data: dict | None = None) -> str:
 # ─────────────────────────────────────────────────────────────────────────────
 # AI helpers
 # ─────────────────────────────────────────────────────────────────────────────
-def _get_ai_response(messages: list, system_prompt: str) -> str:
+def _stream_ai_response(messages: list, system_prompt: str) -> Iterator[str]:
+    """Yield reply tokens as they arrive; render with st.write_stream."""
+    yielded = False
     try:
         client = _groq_client()
-        resp = client.chat.completions.create(
+        stream = client.chat.completions.create(
             messages=[{"role": "system", "content": system_prompt}, *messages],
             model="llama-3.1-8b-instant",
             max_tokens=400,
             temperature=0.8,
+            stream=True,
         )
-        return resp.choices[0].message.content
+        for chunk in stream:
+            token = chunk.choices[0].delta.content or ""
+            if token:
+                yielded = True
+                yield token
     except Exception:
-        return "I am having a brief technical hiccup — could we try that again? 😊"
+        if not yielded:
+            yield "I am having a brief technical hiccup — could we try that again? 😊"
 
 
-def _generate_questions() -> list[dict]:
+def _summarize_messages(msgs: list[dict]) -> str:
+    """Condense older chat turns (including any previous summary); runs on the worker pool."""
+    from app.ai.client import get_client
+    transcript = "\n".join(f"{m['role']}: {m['content']}" for m in msgs)
+    resp = get_client().chat.completions.create(
+        messages=[{
+            "role": "system",
+            "content": (
+                "Summarise this interview chat in at most 3 sentences. Keep the candidate's "
+                "details, which questions were asked and the scores given.\n\n"
+                f"{transcript}"
+            ),
+        }],
+        model="llama-3.1-8b-instant",
+        max_tokens=150,
+        temperature=0.3,
+    )
+    return resp.choices[0].message.content.strip()
+
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def _cached_generate_questions(
+    tech_stack_norm: str, experience_level: str, position_norm: str, _experience: float
+) -> list[dict]:
+    """Cached per (stack, level, position); _experience only shapes the prompt on a miss."""
     from app.ai.question_generator import generate_questions
-    data = st.session_state.candidate
     return generate_questions(
-        tech_stack=data["tech_stack"],
-        experience=float(data["experience"]),
-        position=data["position"],
+        tech_stack=tech_stack_norm,
+        experience=_experience,
+        position=position_norm,
+        use_fallback=False,
+    )
+
+
+def _questions_for(tech_stack: str, experience: float, level: str, position: str) -> list[dict]:
+    """Normalise the cache key, then fetch; safe to call from worker threads."""
+    from app.ai.question_generator import fallback_questions
+    stack_norm = ", ".join(sorted({t.strip() for t in tech_stack.lower().split(",") if t.strip()}))
+    position_norm = " ".join(position.lower().split())
+    try:
+        return _cached_generate_questions(
+            stack_norm, level, position_norm, _experience=experience
+        )
+    except Exception:
+        return fallback_questions()
+
+
+def _generate_questions() -> list[dict]:
+    data = st.session_state.candidate
+    return _questions_for(
+        data["tech_stack"],
+        st.session_state.experience_value,
+        st.session_state.experience_level,
+        data["position"],
+    )
+
+
+def _prefetch_questions() -> None:
+    """Start question generation in the background while the candidate confirms."""
+    data = st.session_state.candidate
+    st.session_state.questions_future = _executor().submit(
+        _questions_for,
+        data["tech_stack"],
+        st.session_state.experience_value,
+        st.session_state.experience_level,
+        data["position"],
     )
 
 
+def _collect_questions() -> list[dict]:
+    """Use the prefetched questions if they arrive in time, else generate inline."""
+    future = st.session_state.questions_future
+    st.session_state.questions_future = None
+    if future is not None:
+        try:
+            return future.result(timeout=15)
+        except Exception:
+            future.cancel()
+    return _generate_questions()
+
+
 def _evaluate(question: str, answer: str) -> dict:
     from app.ai.answer_evaluator import evaluate_answer
     data = st.session_state.candidate
-    exp = float(data["experience"])
-    level = "entry-level" if exp < 2 else "mid-level" if exp < 5 else "senior-level"
     first = _first_name(data)
     return evaluate_answer(
         question=question,
         answer=answer,
         candidate_name=first,
-        experience_level=level,
+        experience_level=st.session_state.experience_level,
         tech_stack=data["tech_stack"],
     )
 
@@ -306,7 +672,7 @@ def _build_summary() -> dict:
         candidate_name=data["name"],
         position=data["position"],
         tech_stack=data["tech_stack"],
-        experience=float(data["experience"]),
+        experience=st.session_state.experience_value,
         questions=qs,
         answers=ans_texts,
         scores=st.session_state.scores,
@@ -538,11 +904,31 @@ def page_home():
     with col_btn:
         if st.button("Begin Interview", type="primary", use_container_width=True):
             st.session_state.page = "interview"
+            _checkpoint()
             st.rerun()
 
 # ─────────────────────────────────────────────────────────────────────────────
 # PAGE: INTERVIEW — sidebar
 # ─────────────────────────────────────────────────────────────────────────────
+@st.cache_data(max_entries=256, show_spinner=False)
+def _masked_info(items: tuple[tuple[str, str], ...]) -> list[tuple[str, str]]:
+    """(label, display) rows for filled fields, with email and phone masked."""
+    rows = []
+    for key, val in items:
+        if not val:
+            continue
+        display = val
+        if key == "email" and "@" in val:
+            local, domain = val.split("@", 1)
+            display = local[:2] + "·" * max(0, len(local) - 2) + "@" + domain
+        elif key == "phone":
+            clean = PHONE_STRIP_RE.sub("", val)
+            if len(clean) > 6:
+                display = clean[:3] + "···" + clean[-3:]
+        rows.append((key.replace("_", " ").title(), display))
+    return rows
+
+
 def _render_sidebar():
     with st.sidebar:
         st.markdown("<div class='ts-sb-section'>Progress</div>", unsafe_allow_html=True)
@@ -566,21 +952,10 @@ def _render_sidebar():
         st.progress(pct)
         st.caption(phase.replace("_", " ").title())
 
-        data = st.session_state.candidate
-        if any(v for v in data.values()):
+        rows = _masked_info(tuple(st.session_state.candidate.items()))
+        if rows:
             st.markdown("<div class='ts-sb-section'>Candidate</div>", unsafe_allow_html=True)
-            for key, val in data.items():
-                if not val:
-                    continue
-                display = val
-                if key == "email" and "@" in val:
-                    local, domain = val.split("@", 1)
-                    display = local[:2] + "·" * max(0, len(local) - 2) + "@" + domain
-                elif key == "phone":
-                    clean = re.sub(r"[^0-9]", "", val)
-                    if len(clean) > 6:
-                        display = clean[:3] + "···" + clean[-3:]
-                label = key.replace("_", " ").title()
+            for label, display in rows:
                 st.markdown(
                     f"<div class='ts-sb-kv'><b>{label}</b>: {display}</div>",
                     unsafe_allow_html=True,
@@ -600,6 +975,7 @@ def _render_sidebar():
         st.markdown("<br>", unsafe_allow_html=True)
         if st.button("← Home", use_container_width=True):
             st.session_state.page = "home"
+            _checkpoint()
             st.rerun()
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -619,22 +995,25 @@ def page_interview():
     )
 
     # Show chat history
+    _apply_compaction()
     for msg in st.session_state.messages:
         with st.chat_message(msg["role"]):
             st.markdown(msg["content"])
 
     # Greet on first load
     if not st.session_state.messages and st.session_state.phase == PHASES["GREETING"]:
-        greeting = _get_ai_response(
-            [],
-            "You are Maya, a friendly hiring assistant for TalentScout. "
-            "Greet the candidate warmly, introduce yourself briefly, explain the process "
-            "(collect info, then 5 technical questions, then results), "
-            "and ask for their full name. Keep it concise and warm.",
-        )
-        st.session_state.messages.append({"role": "assistant", "content": greeting})
+        with st.chat_message("assistant"):
+            greeting = st.write_stream(_stream_ai_response(
+                [],
+                "You are Maya, a friendly hiring assistant for TalentScout. "
+                "Greet the candidate warmly, introduce yourself briefly, explain the process "
+                "(collect info, then 5 technical questions, then results), "
+                "and ask for their full name. Keep it concise and warm.",
+            ))
+        # Already on screen — carry on to the chat input rather than re-rendering via st.rerun()
+        _append_message("assistant", greeting)
         st.session_state.phase = PHASES["DATA_COLLECTION"]
-        st.rerun()
+        _checkpoint()
 
     if st.session_state.phase == PHASES["ENDED"]:
         # Render chat history then show the View Results button inline
@@ -643,6 +1022,7 @@ def page_interview():
         with col_btn:
             if st.button("View Results", type="primary", use_container_width=True, key="top_view_results"):
                 st.session_state.page = "results"
+                _checkpoint()
                 st.rerun()
         return
 
@@ -651,28 +1031,24 @@ def page_interview():
         return
 
     # Display user message
-    st.session_state.messages.append({"role": "user", "content": user_input})
+    _append_message("user", user_input)
     with st.chat_message("user"):
         st.markdown(user_input)
 
-    # ── Exit detection ───────────────────────────────────────────────────────
-    if any(kw in user_input.lower() for kw in EXIT_KEYWORDS):
-        name = _first_name()
-        bot = f"Thank you for your time, {name}! Best of luck on your journey. 👋"
-        st.session_state.messages.append({"role": "assistant", "content": bot})
-        st.session_state.phase = PHASES["ENDED"]
-        with st.chat_message("assistant"):
-            st.markdown(bot)
-        st.rerun()
-        return
-
     phase = st.session_state.phase
     bot = ""
     data = st.session_state.candidate
     first = _first_name(data)
 
+    # ── Exit detection ───────────────────────────────────────────────────────
+    # Falls through to the shared append/display below instead of st.rerun(),
+    # so the history above is not rendered a second time for one message.
+    if EXIT_RE.search(user_input):
+        bot = f"Thank you for your time, {first}! Best of luck on your journey. 👋"
+        st.session_state.phase = PHASES["ENDED"]
+
     # ── DATA COLLECTION ──────────────────────────────────────────────────────
-    if phase == PHASES["DATA_COLLECTION"]:
+    elif phase == PHASES["DATA_COLLECTION"]:
         step = st.session_state.step
         step_cfg = DATA_STEPS[step]
 
@@ -684,39 +1060,43 @@ def page_interview():
 
         if is_valid:
             data[step_cfg["field"]] = extracted  # store clean extracted value, not raw
+            if step_cfg["field"] == "experience":
+                from app.ai.question_generator import experience_label
+                st.session_state.experience_value = float(extracted)
+                st.session_state.experience_level = experience_label(st.session_state.experience_value)
             st.session_state.step += 1
-
-            if step == 1:
-                first = _first_name(data)
-                bot = (
-                    f"Great to meet you, {first}! 😊 "
-                    f"Next — {DATA_STEPS[2]['prompt']}"
-                )
-            elif step == 2:
-                bot = f"Got it, {first}. Next — {DATA_STEPS[3]['prompt']}"
-            elif step == 3:
-                bot = f"Perfect, {first}. Next — {DATA_STEPS[4]['prompt']}"
-            elif step == 4:
-                exp = float(data["experience"])
-                level_msg = (
-                    "Just starting out — exciting!" if exp == 0
-                    else f"{exp} years — great foundation!" if exp < 2
-                    else f"{exp} years of solid experience!" if exp < 5
-                    else f"{exp} years — impressive!"
-                )
-                bot = f"{level_msg} {DATA_STEPS[5]['prompt']}"
-            elif step == 5:
-                bot = (
-                    f"A **{data['position']}** role — excellent choice! "
-                    f"{DATA_STEPS[6]['prompt']}"
-                )
-            elif step == 6:
-                bot = (
-                    f"Location noted. Last one — {DATA_STEPS[7]['prompt']}"
-                )
-
+            # Skip steps already answered (after a rollback from confirmation)
+            while (
+                st.session_state.step <= len(DATA_STEPS)
+                and data[DATA_STEPS[st.session_state.step]["field"]]
+            ):
+                st.session_state.step += 1
+
+            first = _first_name(data)
+            respond = STEP_RESPONSES.get(step)
+            if respond:
+                bot = respond(SimpleNamespace(
+                    first=first, data=data, experience=st.session_state.experience_value,
+                ))
+
+            if step + 1 < st.session_state.step <= len(DATA_STEPS):
+                bot = f"Thanks, {first}. Next — {DATA_STEPS[st.session_state.step]['prompt']}"
+
+            failed = []
             if st.session_state.step > len(DATA_STEPS):
+                with st.spinner("Validating..."):
+                    verdicts = _ai_validate_bulk(data)
+                failed = [n for n, cfg in DATA_STEPS.items() if verdicts.get(cfg["field"]) is False]
+
+            if failed:
+                # Roll back to the first rejected field; others that failed are re-asked after it
+                for n in failed:
+                    data[DATA_STEPS[n]["field"]] = ""
+                st.session_state.step = failed[0]
+                bot = f"Hmm, {first} — {DATA_STEPS[failed[0]]['error']} Could you try again? 😊"
+            elif st.session_state.step > len(DATA_STEPS):
                 st.session_state.phase = PHASES["DATA_CONFIRMATION"]
+                _prefetch_questions()
                 summary_lines = "\n".join(
                     [f"- **{k.replace('_', ' ').title()}:** {v}"
                      for k, v in data.items() if v]
@@ -734,7 +1114,7 @@ def page_interview():
     elif phase == PHASES["DATA_CONFIRMATION"]:
         if any(w in user_input.lower() for w in ("yes", "correct", "confirm", "ok", "proceed", "looks good")):
             with st.spinner("Generating personalised questions..."):
-                questions = _generate_questions()
+                questions = _collect_questions()
 
             st.session_state.questions = questions
             st.session_state.phase = PHASES["TECHNICAL_QUESTIONS"]
@@ -756,6 +1136,18 @@ def page_interview():
         idx = st.session_state.q_index
         current_q = st.session_state.questions[idx]["question"]
 
+        # Draft the lead-in to the next question while this answer is being scored
+        # (skips are answered locally and instantly, so they get no draft)
+        from app.ai.answer_evaluator import is_skip
+        transition_future = None
+        if idx + 1 < len(st.session_state.questions) and not is_skip(user_input):
+            from app.ai.question_generator import generate_transition
+            transition_future = _transition_executor().submit(
+                generate_transition,
+                next_question=st.session_state.questions[idx + 1]["question"],
+                tech_stack=data["tech_stack"],
+            )
+
         with st.spinner("Evaluating your answer..."):
             evaluation = _evaluate(current_q, user_input)
 
@@ -780,8 +1172,19 @@ def page_interview():
             nxt = st.session_state.questions[st.session_state.q_index]
             nq_text = nxt["question"]
             diff_badge = f"[{nxt['difficulty'].upper()}]"
+            # The draft has had the whole evaluation to finish; allow a short grace.
+            transition = None
+            if transition_future is not None:
+                try:
+                    transition = transition_future.result(timeout=1.5)
+                except Exception:
+                    # Only dequeues a draft that has not started; a running Groq call
+                    # cannot be stopped and finishes on the transition pool.
+                    transition_future.cancel()
+            lead_in = f"{transition}\n\n" if transition else ""
             bot += (
                 f"\n\n---\n\n"
+                f"{lead_in}"
                 f"**Question {st.session_state.q_index + 1} of {len(st.session_state.questions)}**"
                 f" {diff_badge}\n\n{nq_text}"
             )
@@ -793,7 +1196,7 @@ def page_interview():
             
             # Save interview to local storage
             try:
-                save_interview(
+                st.session_state.interview_id = save_interview(
                     candidate_data=st.session_state.candidate,
                     questions=st.session_state.questions,
                     answers=[e.get("_raw_answer", "") for e in st.session_state.evaluations],
@@ -817,9 +1220,11 @@ def page_interview():
 
     # ── Append and display bot response ─────────────────────────────────────
     if bot:
-        st.session_state.messages.append({"role": "assistant", "content": bot})
+        _append_message("assistant", bot)
         with st.chat_message("assistant"):
             st.markdown(bot)
+        _schedule_compaction()
+    _checkpoint()
 
     # Show "View Results" button inline (no rerun — avoids scroll-to-top)
     if st.session_state.phase == PHASES["ENDED"]:
@@ -828,6 +1233,7 @@ def page_interview():
         with col_btn:
             if st.button("View Results", type="primary", use_container_width=True):
                 st.session_state.page = "results"
+                _checkpoint()
                 st.rerun()
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -850,6 +1256,7 @@ def page_results():
         st.warning("No interview results found. Please complete an interview first.")
         if st.button("Begin Interview"):
             st.session_state.page = "home"
+            _checkpoint()
             st.rerun()
         return
 
@@ -999,6 +1406,7 @@ elif page == "results":
     page_results()
 else:
     st.session_state.page = "home"
+    _checkpoint()
     st.rerun()
 
 # ── Footer ───────────────────────────────────────────────────────────────────
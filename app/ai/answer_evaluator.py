@@ -1,4 +1,4 @@
-import json
+import orjson
 from app.ai.client import get_client
 from app.utils.logger import get_logger
 
@@ -7,6 +7,12 @@ logger = get_logger(__name__)
 _SKIP_PHRASES = {"skip", "idk", "i don't know", "i dont know", "next", "pass", "no idea"}
 
 
+def is_skip(answer: str) -> bool:
+    """True if the answer is a skip request, which evaluate_answer handles without a model call."""
+    lower = answer.lower()
+    return any(phrase in lower for phrase in _SKIP_PHRASES)
+
+
 def evaluate_answer(
     question: str,
     answer: str,
@@ -15,7 +21,7 @@ def evaluate_answer(
     tech_stack: str,
 ) -> dict:
     """Evaluate an answer and return score (0-10), feedback, explanation, key points."""
-    if any(phrase in answer.lower() for phrase in _SKIP_PHRASES):
+    if is_skip(answer):
         return {
             "score": 0,
             "feedback": f"No worries, {candidate_name}! We'll skip that one.",
@@ -28,30 +34,27 @@ def evaluate_answer(
     try:
         client = get_client()
         prompt = (
-            f"You are a strict but encouraging technical interviewer evaluating a "
-            f"{experience_level} {tech_stack} candidate named {candidate_name}.\n\n"
-            f"Question: \"{question}\"\n"
-            f"Answer: \"{answer}\"\n\n"
-            "Evaluate the answer and return ONLY valid JSON:\n"
-            "{\n"
-            "  \"score\": <integer 0-10>,\n"
-            "  \"feedback\": \"<1-2 sentence personalised feedback using candidate name>\",\n"
-            "  \"explanation\": \"<correct/complete answer starting with 'Here is the breakdown:'>\",\n"
-            "  \"key_points_covered\": [\"point1\"],\n"
-            "  \"missing_points\": [\"point1\"]\n"
-            "}\n\n"
+            f"Strict but encouraging interviewer; {experience_level} {tech_stack} candidate "
+            f"{candidate_name}.\n"
+            f"Q: \"{question}\"\n"
+            f"A: \"{answer}\"\n"
+            "Return ONLY JSON: {\"score\": <0-10>, "
+            "\"feedback\": \"<1-2 sentences, address them by name>\", "
+            "\"explanation\": \"<concise correct answer, starting 'Here is the breakdown:'>\"}\n"
             "Scoring: 9-10 Excellent | 7-8 Good | 5-6 Partial | 3-4 Basic | 1-2 Attempted | 0 Irrelevant"
         )
         response = client.chat.completions.create(
             messages=[{"role": "user", "content": prompt}],
             model="llama-3.1-8b-instant",
-            max_tokens=700,
+            max_tokens=350,
             temperature=0.3,
             response_format={"type": "json_object"},
         )
-        result = json.loads(response.choices[0].message.content)
+        result = orjson.loads(response.choices[0].message.content)
         result["skipped"] = False
         result.setdefault("score", 5)
+        result.setdefault("key_points_covered", [])
+        result.setdefault("missing_points", [])
         return result
     except Exception as exc:
         logger.error(f"Answer evaluation error: {exc}")
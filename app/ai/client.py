@@ -1,18 +1,33 @@
 import os
+import threading
+import httpx
 from groq import Groq
 from app.utils.logger import get_logger
 from app.utils.errors import AIError
 
 logger = get_logger(__name__)
 _client = None
+_client_lock = threading.Lock()
+
+
+def _http_client() -> httpx.Client:
+    """One keep-alive HTTP/2 pool shared by every Groq request in the process."""
+    return httpx.Client(
+        http2=True,
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+    )
 
 
 def get_client() -> Groq:
     global _client
     if _client is None:
-        api_key = os.getenv("GROQ_API_KEY")
-        if not api_key:
-            raise AIError("GROQ_API_KEY not configured")
-        _client = Groq(api_key=api_key)
-        logger.info("Groq AI client initialised")
+        # Worker threads may race the first call; build exactly one client
+        with _client_lock:
+            if _client is None:
+                api_key = os.getenv("GROQ_API_KEY")
+                if not api_key:
+                    raise AIError("GROQ_API_KEY not configured")
+                _client = Groq(api_key=api_key, http_client=_http_client())
+                logger.info("Groq AI client initialised")
     return _client
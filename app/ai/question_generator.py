@@ -1,5 +1,6 @@
 import json
 from app.ai.client import get_client
+from app.utils.errors import AIError
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -21,7 +22,7 @@ def _difficulty_plan(experience: float) -> list[str]:
     return ["medium", "hard", "hard", "hard", "hard"]
 
 
-def _experience_label(experience: float) -> str:
+def experience_label(experience: float) -> str:
     if experience < 2:
         return "entry-level"
     if experience < 5:
@@ -29,12 +30,24 @@ def _experience_label(experience: float) -> str:
     return "senior-level"
 
 
+def fallback_questions(num_questions: int = 5) -> list[dict]:
+    """Generic questions used when the model call fails."""
+    return [dict(q) for q in _FALLBACK[:num_questions]]
+
+
 def generate_questions(
-    tech_stack: str, experience: float, position: str, num_questions: int = 5
+    tech_stack: str,
+    experience: float,
+    position: str,
+    num_questions: int = 5,
+    use_fallback: bool = True,
 ) -> list[dict]:
-    """Return a list of {question, difficulty} dicts tailored to the candidate."""
+    """Return a list of {question, difficulty} dicts tailored to the candidate.
+
+    With use_fallback=False, failures raise AIError instead of returning generic questions.
+    """
     plan = _difficulty_plan(experience)
-    level = _experience_label(experience)
+    level = experience_label(experience)
 
     try:
         client = get_client()
@@ -68,7 +81,9 @@ def generate_questions(
     except Exception as exc:
         logger.error(f"Question generation failed: {exc}")
 
-    return _FALLBACK[:num_questions]
+    if not use_fallback:
+        raise AIError("Question generation returned no usable questions")
+    return fallback_questions(num_questions)
 
 
 def generate_followup(original_question: str, answer: str) -> str | None:
@@ -94,3 +109,28 @@ def generate_followup(original_question: str, answer: str) -> str | None:
         return fu if fu and str(fu).lower() != "null" else None
     except Exception:
         return None
+
+
+def generate_transition(next_question: str, tech_stack: str) -> str | None:
+    """Return a one-line lead-in to the next question or None on failure."""
+    try:
+        client = get_client()
+        prompt = (
+            f"You are Maya, a friendly interviewer assessing a {tech_stack} candidate.\n"
+            f"The next question is: {next_question}\n\n"
+            "Write ONE short, warm sentence (max 20 words) that leads into it. "
+            "Do not repeat or answer the question.\n"
+            "Return JSON: {\"transition\": \"sentence\"}"
+        )
+        response = client.chat.completions.create(
+            messages=[{"role": "user", "content": prompt}],
+            model="llama-3.1-8b-instant",
+            max_tokens=60,
+            temperature=0.7,
+            response_format={"type": "json_object"},
+        )
+        result = json.loads(response.choices[0].message.content)
+        line = result.get("transition")
+        return str(line).strip() if line else None
+    except Exception:
+        return None
@@ -1,11 +1,16 @@
 """
 Local file-based storage for interview data.
-Stores each interview as a JSON file in data/interviews/ folder.
+Stores each interview as a JSON file in data/interviews/ folder, and
+in-progress session checkpoints in data/sessions/.
 """
 import json
 import os
+import re
 from datetime import datetime
 from pathlib import Path
+
+import orjson
+
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -13,6 +18,10 @@ logger = get_logger(__name__)
 # Data directory
 DATA_DIR = Path("data") / "interviews"
 DATA_DIR.mkdir(parents=True, exist_ok=True)
+CHECKPOINT_DIR = Path("data") / "sessions"
+CHECKPOINT_DIR.mkdir(parents=True, exist_ok=True)
+
+_SESSION_ID_RE = re.compile(r"^[0-9a-f]{32}$")
 
 
 def save_interview(candidate_data: dict, questions: list, answers: list, scores: list, summary: dict) -> str:
@@ -83,3 +92,63 @@ def cleanup_old_interviews(days: int = 30) -> int:
     except Exception as e:
         logger.error(f"Failed to cleanup interviews: {e}")
     return deleted
+
+
+def _checkpoint_path(session_id: str) -> Path | None:
+    if not _SESSION_ID_RE.match(session_id or ""):
+        return None
+    return CHECKPOINT_DIR / f"{session_id}.json"
+
+
+def save_checkpoint(session_id: str, state: dict) -> None:
+    """
+    Atomically write in-progress session state: dump to a temp file, then
+    rename over the previous checkpoint so a crash never leaves half a file.
+    """
+    path = _checkpoint_path(session_id)
+    if path is None:
+        return
+    tmp = path.with_suffix(".json.tmp")
+    try:
+        tmp.write_bytes(orjson.dumps(state))
+        tmp.replace(path)
+    except Exception as e:
+        logger.error(f"Failed to checkpoint session {session_id}: {e}")
+
+
+def load_checkpoint(session_id: str) -> dict | None:
+    """Return the last checkpoint for a session, or None."""
+    path = _checkpoint_path(session_id)
+    try:
+        if path is not None and path.exists():
+            return orjson.loads(path.read_bytes())
+    except Exception as e:
+        logger.error(f"Failed to load checkpoint {session_id}: {e}")
+    return None
+
+
+def delete_checkpoint(session_id: str) -> None:
+    path = _checkpoint_path(session_id)
+    try:
+        if path is not None:
+            path.unlink(missing_ok=True)
+    except Exception as e:
+        logger.error(f"Failed to delete checkpoint {session_id}: {e}")
+
+
+def cleanup_old_checkpoints(hours: int = 24) -> int:
+    """Delete session checkpoints (and stray temp files) untouched for N hours. Returns count deleted."""
+    from datetime import timedelta
+    cutoff = datetime.now() - timedelta(hours=hours)
+    deleted = 0
+    try:
+        for filepath in CHECKPOINT_DIR.glob("*.json*"):
+            file_time = datetime.fromtimestamp(filepath.stat().st_mtime)
+            if file_time < cutoff:
+                filepath.unlink(missing_ok=True)
+                deleted += 1
+        if deleted:
+            logger.info(f"Deleted {deleted} stale session checkpoint(s)")
+    except Exception as e:
+        logger.error(f"Failed to cleanup checkpoints: {e}")
+    return deleted